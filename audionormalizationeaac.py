@@ -2,43 +2,497 @@ import sys
 import os
 import subprocess
 import json
+import hashlib
+import sqlite3
 import shlex
+import shutil
 import time
 import threading
+from dataclasses import dataclass
+from typing import Optional
+import re
+import queue
+import selectors
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from collections import OrderedDict, deque
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import orjson  # optional, faster JSON for ffprobe output and the probe cache
+    _loads = orjson.loads
+    _dumps = orjson.dumps   # bytes
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps     # str; both go into the same BLOB column and _loads reads either
+try:
+    # optional: lets us stat the growing output only when ffmpeg actually wrote to it (Linux)
+    from inotify_simple import INotify, flags as inotify_flags, parse_events as parse_inotify_events
+except ImportError:
+    INotify = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QLineEdit, QPushButton, QFileDialog, QProgressBar,
-                             QTextEdit, QGroupBox, QComboBox, QMessageBox, QSplitter, QCheckBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                             QPlainTextEdit, QGroupBox, QComboBox, QMessageBox, QSplitter, QCheckBox,
+                             QSpinBox, QListView, QAbstractItemView, QSizePolicy)
+from PyQt5.QtCore import (Qt, QThread, QTimer, QEventLoop, QStringListModel, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
 from PyQt5.QtGui import QFont
 
+PIPE_CAPACITY = 1 << 20  # kernel pipe size requested for ffmpeg stdout/stderr (F_SETPIPE_SZ)
+READ_CHUNK = 1 << 16     # minimum bytes per read() from those pipes
+POLL_INTERVAL = 0.25     # seconds between output-size polls / progress recomputes
+EMIT_INTERVAL = 0.1      # min seconds between progress signals from one worker
+SPEED_EMA_ALPHA = 0.1    # weight of the newest speed= sample in the smoothed speed used for the ETA
+LOG_BATCH_LINES = 16     # ffmpeg log lines per log_updated signal
+ERROR_TAIL_LINES = 20    # last ffmpeg log lines quoted when a conversion fails
+LOG_MAX_BLOCKS = 2000    # lines kept in the GUI log; older ones are dropped
+PREPARE_AHEAD = 4        # probed + built jobs queued ahead of the ffmpeg workers
+PROBE_WORKERS = 8        # ffprobe processes run in parallel while preparing the queue
+GUI_REFRESH_MS = 50      # GUI applies coalesced progress/log updates at most every 50 ms
+SUPPORTED_EXTS = (".mkv", ".mka", ".flac", ".wav", ".mp4", ".m4a", ".mp3")
+MEDIA_FILE_FILTER = f"Media Files ({' '.join('*' + e for e in SUPPORTED_EXTS)});;All Files (*)"
+# options every ffmpeg conversion starts with: progress as key=value on stdout, only errors on stderr
+FFMPEG_COMMON_ARGS = ("-y", "-nostdin", "-hide_banner", "-progress", "pipe:1", "-nostats", "-loglevel", "error")
+USE_SELECTORS = os.name != "nt"  # Windows can't select() on pipes
+WAKE = object()  # selector tag for the stop() self-pipe
+
+def enlarge_pipe(pipe, size=PIPE_CAPACITY):
+    """
+    Raise the kernel capacity of a pipe (64 KiB by default on Linux) so ffmpeg doesn't block
+    on write while we are busy. Best effort: unprivileged callers are capped by
+    /proc/sys/fs/pipe-max-size. Windows anonymous pipes (~4 KiB) can't be resized after creation.
+    Returns the capacity now in effect, or READ_CHUNK where it can't be queried.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return READ_CHUNK
+    fd = pipe.fileno()
+    try:
+        return fcntl.fcntl(fd, getattr(fcntl, "F_SETPIPE_SZ", 1031), size)
+    except Exception:
+        pass
+    try:
+        return fcntl.fcntl(fd, getattr(fcntl, "F_GETPIPE_SZ", 1032))
+    except Exception:
+        return READ_CHUNK
+
+def drop_page_cache(path):
+    """
+    Ask the kernel to evict a finished output from the page cache (Linux; no-op elsewhere).
+    Only clean pages go; data still being written back stays until it is flushed.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def spawn_kwargs():
+    """
+    Popen kwargs for ffmpeg/ffprobe. On POSIX, close_fds=False lets CPython use
+    posix_spawn (vfork-style) instead of fork()ing the whole GUI process; our own
+    fds are non-inheritable (PEP 446), so nothing extra leaks into the child.
+    On Windows, no console window and a hidden SW_HIDE start so the child skips
+    console setup.
+    """
+    if os.name != "nt":
+        return {"close_fds": False}
+    si = subprocess.STARTUPINFO()
+    si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    si.wShowWindow = 0  # SW_HIDE
+    return {"creationflags": subprocess.CREATE_NO_WINDOW, "startupinfo": si}
+
+_NUM = r"([0-9]*\.?[0-9]+(?:e[-+]?[0-9]+)?)"   # ffmpeg prints large speeds as e.g. 1.2e+03x
+_BITRATE_RE = re.compile(r"^\s*" + _NUM + r"\s*([km]?)\s*$", re.I)
+# bytes pattern: speed= values come straight from the progress pipe, float() takes bytes as-is
+_SPEED_RE = re.compile((r"^\s*" + _NUM + r"\s*x?\s*$").encode("ascii"), re.I)
+_BITRATE_MULT = {"": 1, "k": 1000, "m": 1000_000}
+
 def parse_bitrate_to_bps(txt):
     if txt is None:
         return 0
-    s = str(txt).strip().lower().replace(' ', '')
-    mult = 1
-    if s.endswith('k'):
-        mult = 1000
-        s = s[:-1]
-    elif s.endswith('m'):
-        mult = 1000_000
-        s = s[:-1]
+    m = _BITRATE_RE.match(str(txt))
+    if not m:
+        return 0
+    return int(float(m.group(1)) * _BITRATE_MULT[m.group(2).lower()])
+
+def parse_speed_x(value):
+    m = _SPEED_RE.match(value or b"")
+    return float(m.group(1)) if m else 0.0
+
+def default_parallel_jobs():
+    return max(1, (os.cpu_count() or 1) // 2)
+
+# ---------- hardware video encoders ----------
+HW_VIDEO_ENCODERS = ("h264_nvenc", "hevc_nvenc", "h264_qsv", "hevc_qsv", "h264_vaapi", "hevc_vaapi")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+def is_hw_encoder(codec):
+    return codec in HW_VIDEO_ENCODERS
+
+def hw_input_args(codec):
+    """Global/input args for a hardware encoder: decode on the GPU where possible."""
+    args = ["-hwaccel", "auto"]
+    if codec.endswith("_vaapi"):
+        args += ["-vaapi_device", VAAPI_DEVICE]
+    return args
+
+def hw_encoder_args(codec, quality):
+    """
+    Output args for a hardware encoder: 8-bit 4:2:0 in constant-quality mode,
+    `quality` on the same scale as x264's CRF.
+    """
+    q = str(quality)
+    if codec.endswith("_nvenc"):
+        return ["-pix_fmt", "yuv420p", "-rc", "vbr", "-cq", q, "-b:v", "0"]
+    if codec.endswith("_qsv"):
+        return ["-pix_fmt", "nv12", "-global_quality", q]
+    if codec.endswith("_vaapi"):
+        return ["-vf", "format=nv12,hwupload", "-qp", q]
+    return []
+
+def detect_hw_encoders(ffmpeg_bin):
+    """
+    Hardware video encoders that actually work here. ffmpeg builds list the
+    nvenc/qsv/vaapi encoders whether or not the hardware exists, so each one
+    listed by `ffmpeg -encoders` is confirmed with a one-frame test encode.
+    """
     try:
-        val = float(s)
-        return int(val * mult)
+        listing = subprocess.run([ffmpeg_bin, "-hide_banner", "-encoders"],
+                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                 text=True, timeout=10, **spawn_kwargs()).stdout
     except Exception:
+        return []
+    listed = {parts[1] for parts in (line.split() for line in listing.splitlines()) if len(parts) > 1}
+    found = []
+    for codec in HW_VIDEO_ENCODERS:
+        if codec not in listed:
+            continue
+        if codec.endswith("_vaapi") and not os.path.exists(VAAPI_DEVICE):
+            continue
+        cmd = [ffmpeg_bin, "-hide_banner", "-loglevel", "error",
+               *(["-vaapi_device", VAAPI_DEVICE] if codec.endswith("_vaapi") else []),
+               "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+               "-frames:v", "1", "-c:v", codec, *hw_encoder_args(codec, 23), "-f", "null", "-"]
         try:
-            return int(s)
+            if subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                              timeout=10, **spawn_kwargs()).returncode == 0:
+                found.append(codec)
         except Exception:
-            return 0
+            pass
+    return found
+
+# ---------- ffmpeg -progress parsing ----------
+# One findall() over a block of complete lines pulls out only the keys we use.
+_PROG_RE = re.compile(rb'^(out_time_us|out_time_ms|out_time|total_size|speed|progress)=[ \t]*(.*?)\s*$', re.M)
+
+class ProgressState:
+    """What ffmpeg's -progress output has reported so far for one file (one per worker loop)."""
+    __slots__ = ("out_time", "have_time", "total_size", "speed", "ended")
+
+    def __init__(self):
+        self.out_time = 0.0
+        self.have_time = False
+        self.total_size = 0
+        self.speed = 0.0
+        self.ended = False
+
+def _h_out_time_us(prog, value):
+    if value.isdigit():
+        prog.out_time = int(value) * 1e-6
+        prog.have_time = True
+
+_HMS_RE = re.compile(rb"(\d+):(\d{2}):(\d{2}(?:\.\d+)?)$")
+
+def _h_out_time(prog, value):
+    # hh:mm:ss.micro; "N/A" (audio-only) or negative values don't match
+    m = _HMS_RE.match(value)
+    if m:
+        h, mi, sec = m.groups()
+        prog.out_time = int(h) * 3600 + int(mi) * 60 + float(sec)
+        prog.have_time = True
+
+def _h_total_size(prog, value):
+    if value.isdigit():
+        prog.total_size = int(value)
+
+def _h_speed(prog, value):
+    prog.speed = parse_speed_x(value)
+
+def _h_progress(prog, value):
+    # closes every progress block: "continue" while running, "end" once ffmpeg is done
+    if value == b"end":
+        prog.ended = True
+
+PROGRESS_HANDLERS = {
+    b"out_time_us": _h_out_time_us,
+    # despite the name, ffmpeg reports microseconds here too (same value as out_time_us,
+    # kept for older builds that don't print out_time_us)
+    b"out_time_ms": _h_out_time_us,
+    b"out_time": _h_out_time,
+    b"total_size": _h_total_size,
+    b"speed": _h_speed,
+    b"progress": _h_progress,
+}
+
+def _int_or_none(value):
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+@dataclass(frozen=True)
+class AudioStream:
+    """One ffprobe audio stream with its numeric fields parsed once."""
+    __slots__ = ("index", "codec", "channels", "sample_rate", "bit_rate")
+    index: Optional[int]
+    codec: str
+    channels: Optional[int]
+    sample_rate: Optional[int]
+    bit_rate: Optional[int]
+
+    @classmethod
+    def from_probe(cls, st):
+        # Matroska usually has no stream bit_rate, only the BPS statistics tag
+        bit_rate = st.get("bit_rate") or (st.get("tags") or {}).get("BPS")
+        return cls(_int_or_none(st.get("index")),
+                   (st.get("codec_name") or "").lower(),
+                   _int_or_none(st.get("channels")),
+                   _int_or_none(st.get("sample_rate")),
+                   _int_or_none(bit_rate))
+
+@dataclass(frozen=True)
+class PipelineTask:
+    """A probed file with its ffmpeg command built, ready for the encode stage."""
+    __slots__ = ("index", "name", "output_path", "cmd", "duration_s", "target_bps")
+    index: int
+    name: str
+    output_path: str
+    cmd: list
+    duration_s: float
+    target_bps: int
+
+def _cache_dir():
+    # %LOCALAPPDATA% on Windows, $XDG_CACHE_HOME (default ~/.cache) elsewhere
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return os.environ["LOCALAPPDATA"]
+    return os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+PROBE_CACHE_PATH = os.path.join(_cache_dir(), "audio-encoder", "probe.sqlite")
+PROBE_CACHE_MAX_AGE_DAYS = 30
+# only what probe_all() reads: audio stream params (+ Matroska BPS tag), video pix_fmt/profile, duration
+PROBE_ENTRIES = ("stream=index,codec_type,codec_name,channels,sample_rate,bit_rate,pix_fmt,profile"
+                 ":stream_tags=BPS:format=duration")
+PROBE_MEMO_SIZE = 4096   # probe results kept in memory for the whole session
+
+class ProbeCache:
+    """
+    Small on-disk cache of ffprobe JSON keyed by (abs path, mtime, size), so re-running
+    the same queue doesn't probe again. Shared by all pool workers. Any sqlite problem
+    just disables the cache; probing then works as before.
+    An in-memory LRU in front of it (shared by every instance, i.e. the whole session)
+    skips sqlite and JSON decoding for files already seen, and still works without sqlite.
+    """
+    _memo = OrderedDict()
+    _memo_lock = threading.Lock()
+
+    def __init__(self, path=PROBE_CACHE_PATH, max_age_days=PROBE_CACHE_MAX_AGE_DAYS):
+        self._lock = threading.Lock()
+        self._db = None
+        self.error = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            # WAL + NORMAL so concurrent workers don't serialize on fsync
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS probe (key TEXT PRIMARY KEY, json BLOB, ts INTEGER)")
+            db.execute("DELETE FROM probe WHERE ts < ?", (int(time.time()) - max_age_days * 86400,))
+            db.commit()
+            self._db = db
+        except Exception as e:
+            self.error = str(e)
+
+    @staticmethod
+    def key_for(file_path):
+        st = os.stat(file_path)
+        raw = f"{os.path.abspath(file_path)}\0{st.st_mtime_ns}\0{st.st_size}"
+        return hashlib.blake2b(raw.encode("utf-8", "surrogateescape"), digest_size=16).hexdigest()
+
+    @classmethod
+    def _remember(cls, key, data):
+        with cls._memo_lock:
+            cls._memo[key] = data
+            cls._memo.move_to_end(key)
+            if len(cls._memo) > PROBE_MEMO_SIZE:
+                cls._memo.popitem(last=False)
+
+    def get(self, key):
+        with self._memo_lock:
+            data = self._memo.get(key)
+            if data is not None:
+                self._memo.move_to_end(key)
+                return data
+        if self._db is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT json FROM probe WHERE key = ?", (key,)).fetchone()
+            data = _loads(row[0]) if row else None
+        except Exception:
+            return None
+        if data is not None:
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        self._remember(key, data)
+        if self._db is None:
+            return
+        try:
+            with self._lock:
+                self._db.execute("INSERT OR REPLACE INTO probe (key, json, ts) VALUES (?, ?, ?)",
+                                 (key, _dumps(data), int(time.time())))
+                self._db.commit()
+        except Exception:
+            pass
+
+    def close(self):
+        if self._db is not None:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+            self._db = None
+
+class PipeReader:
+    """
+    Waits on several ffmpeg pipes at once and returns whatever bytes arrived.
+    On POSIX this is a selector (plus an optional wake-up fd so stop() can interrupt the wait);
+    Windows can't select() on pipes, so there each pipe gets a small reader thread feeding a queue.
+    """
+
+    def __init__(self, pipes, wake_fd=None, read_size=READ_CHUNK):
+        self.open = set(pipes)
+        if USE_SELECTORS:
+            self._sel = selectors.DefaultSelector()
+            # one preallocated buffer, a full pipe's worth, so a single readv() drains a pipe
+            # without allocating a pipe-sized bytes object per read
+            self._buf = bytearray(read_size)
+            self._view = memoryview(self._buf)
+            for name, pipe in pipes.items():
+                self._sel.register(pipe, selectors.EVENT_READ, name)
+            if wake_fd is not None:
+                self._sel.register(wake_fd, selectors.EVENT_READ, WAKE)
+        else:
+            self._queue = queue.Queue()
+            for name, pipe in pipes.items():
+                threading.Thread(target=self._pump, args=(name, pipe), daemon=True).start()
+
+    def watch(self, name, fileobj):
+        """Also wake up for a non-pipe fd (e.g. inotify). POSIX only; it never counts as open."""
+        self._sel.register(fileobj, selectors.EVENT_READ, name)
+
+    def unwatch(self, fileobj):
+        self._sel.unregister(fileobj)
+
+    def _pump(self, name, pipe):
+        while True:
+            try:
+                chunk = os.read(pipe.fileno(), READ_CHUNK)
+            except OSError:
+                chunk = b""
+            self._queue.put((name, chunk))
+            if not chunk:
+                break
+
+    def read(self, timeout):
+        """
+        Return a list of (pipe name, bytes) received within `timeout` seconds
+        (None: wait until something arrives).
+        An empty bytes value means that pipe hit EOF (it is then dropped from `open`).
+        """
+        events = []
+        if USE_SELECTORS:
+            for key, _ in self._sel.select(timeout):
+                if key.data is WAKE:
+                    continue  # wake-up fd: the caller re-checks its stop flag
+                n = os.readv(key.fd, (self._buf,))
+                chunk = self._view[:n].tobytes()
+                if not chunk:
+                    self._sel.unregister(key.fileobj)
+                    self.open.discard(key.data)
+                events.append((key.data, chunk))
+        else:
+            try:
+                item = self._queue.get(timeout=timeout)
+                while True:
+                    if not item[1]:
+                        self.open.discard(item[0])
+                    events.append(item)
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+        return events
+
+    def close(self):
+        if USE_SELECTORS:
+            self._sel.close()
+            self._view.release()
+
+class DirScanSignals(QObject):
+    files_ready = pyqtSignal(str, list)
+    scan_failed = pyqtSignal(str, str)
+
+
+class DirScanTask(QRunnable):
+    """
+    Lists the supported media files of one directory on a QThreadPool thread,
+    so a slow (e.g. network) directory doesn't stall the GUI.
+    """
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.signals = DirScanSignals()
+
+    def run(self):
+        try:
+            # scandir gets the entry type from the directory read itself: no stat per file
+            with os.scandir(self.directory) as it:
+                files = [e.path for e in it
+                         if e.name.lower().endswith(SUPPORTED_EXTS) and e.is_file()]
+        except Exception as e:
+            self.signals.scan_failed.emit(self.directory, str(e))
+            return
+        self.signals.files_ready.emit(self.directory, files)
+
+
+class HwDetectSignals(QObject):
+    encoders_found = pyqtSignal(list)
+
+
+class HwDetectTask(QRunnable):
+    """
+    Runs detect_hw_encoders() on a QThreadPool thread: the test encodes can take
+    seconds (driver init), which would otherwise hold up the window at startup.
+    """
+    def __init__(self, ffmpeg_bin):
+        super().__init__()
+        self.ffmpeg_bin = ffmpeg_bin
+        self.signals = HwDetectSignals()
+
+    def run(self):
+        self.signals.encoders_found.emit(detect_hw_encoders(self.ffmpeg_bin))
 
-def parse_speed_x(value):
-    v = (value or "").strip().lower().replace(" ", "")
-    if v.endswith('x'):
-        v = v[:-1]
-    try:
-        return float(v)
-    except Exception:
-        return 0.0
 
 class AudioConverterThread(QThread):
     overall_progress_updated = pyqtSignal(int)
@@ -55,69 +509,78 @@ class AudioConverterThread(QThread):
         self.output_dir = output_dir
         self.config = config
         self._is_running = True
+        self._threads_per_job = 1
+        self._progress_lock = threading.Lock()
+        self._file_fractions = {}   # file index -> 0..1, summed into the overall bar
+        self._active = {}           # file index -> base name, in start order
+        self._current = None        # file index shown in the "current file" row
+        self._probe_cache = ProbeCache()
+        # binaries are resolved once (by the app at startup when available), not per spawn
+        self._ffmpeg = config.get("ffmpeg_bin") or shutil.which("ffmpeg") or "ffmpeg"
+        self._ffprobe = config.get("ffprobe_bin") or shutil.which("ffprobe") or "ffprobe"
+        # the config is fixed for the whole run, so build the constant command pieces once
+        self._base_cmd_prefix = (self._ffmpeg, *FFMPEG_COMMON_ARGS)
+        self._subs_data_args = ("-c:s", config["subtitle_codec"], "-c:t", "copy", "-c:d", "copy")
+        self._a_channels = int(config["channels"])
+        self._a_rate = int(config["samplerate"])
+        self._a_target_bps = parse_bitrate_to_bps(config["bitrate"])
+        self._a_args_template = ("aac", config["bitrate"], str(self._a_channels), str(self._a_rate))
+        title = config.get("metadata_title")
+        self._out_tail_args = ("-aac_coder", "twoloop",
+                               *(("-metadata:s:a", f"title={title}") if title else ()))
+        # self-pipe: stop() writes a byte so workers blocked in select() wake up immediately
+        self._wake_r, self._wake_w = os.pipe() if USE_SELECTORS else (None, None)
+        # stop() (GUI thread) writes and run() closes: without the lock a reused fd number
+        # could get the wake byte
+        self._wake_lock = threading.Lock()
 
     # ---------- helpers ----------
-    def _drain_stderr(self, pipe):
-        for line in iter(pipe.readline, ''):
-            txt = line.strip()
-            if txt:
-                self.log_updated.emit(txt)
-        try:
-            pipe.close()
-        except Exception:
-            pass
-
-    def get_audio_stream_metadata(self, file_path):
+    def _emit_log_lines(self, raw_lines):
+        # one queued signal per batch instead of one per line; returns the decoded lines
+        lines = [txt for txt in (raw.decode("utf-8", "replace").strip() for raw in raw_lines) if txt]
+        for start in range(0, len(lines), LOG_BATCH_LINES):
+            self.log_updated.emit("\n".join(lines[start:start + LOG_BATCH_LINES]))
+        return lines
+
+    def probe_all(self, file_path):
         """
-        Try multiple ways to discover audio streams. Do NOT fail the whole file if probing breaks.
-        Returns a list of audio stream dicts, or [] if unknown.
+        Probe duration + all streams with a single ffprobe call (only the fields we use) and
+        slice the result in Python.
+        Returns ([AudioStream], video_info dict, duration_s). Do NOT fail the whole file if probing breaks.
         """
-        cmd1 = ["ffprobe","-v","quiet","-print_format","json",
-                "-show_entries","stream=index:codec_type:codec_name:channels:sample_rate",
-                "-select_streams","a", file_path]
+        base_name = os.path.basename(file_path)
         try:
-            p = subprocess.run(cmd1, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                               text=True, check=True, encoding="utf-8", errors="replace")
-            data = json.loads(p.stdout or "{}")
-            return data.get("streams", [])
-        except Exception as e1:
-            self.log_updated.emit(f"Audio probe fallback #1: {os.path.basename(file_path)} ({e1})")
-            cmd2 = ["ffprobe","-v","error","-of","json","-show_streams", file_path]
+            cache_key = ProbeCache.key_for(file_path)
+        except OSError:
+            cache_key = None
+        data = self._probe_cache.get(cache_key) if cache_key else None
+
+        if data is None:
+            cmd = [self._ffprobe,"-v","error","-print_format","json",
+                   "-show_entries", PROBE_ENTRIES, file_path]
             try:
-                p2 = subprocess.run(cmd2, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                    text=True, check=True, encoding="utf-8", errors="replace")
-                data2 = json.loads(p2.stdout or "{}")
-                streams = [s for s in data2.get("streams", []) if s.get("codec_type") == "audio"]
-                return streams
-            except Exception as e2:
-                self.log_updated.emit(f"Audio probe fallback #2: {os.path.basename(file_path)} ({e2})")
-                try:
-                    p3 = subprocess.run(["ffprobe","-show_streams","-of","json", file_path],
-                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                        text=True, check=False, encoding="utf-8", errors="replace")
-                    data3 = json.loads(p3.stdout or "{}")
-                    streams = [s for s in data3.get("streams", []) if s.get("codec_type") == "audio"]
-                    return streams
-                except Exception as e3:
-                    self.log_updated.emit(f"Audio probe failed for {os.path.basename(file_path)}: {e3}")
-                    return []  # unknown
-
-    def get_video_info(self, file_path):
-        """
-        Probe first video stream for pix_fmt/codec/profile/level. Return dict, tolerate failures.
-        """
-        cmd = ["ffprobe","-v","error","-select_streams","v:0",
-               "-show_entries","stream=pix_fmt,codec_name,profile,level",
-               "-of","json", file_path]
+                # bytes straight into the JSON parser: no decode to str first
+                p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   check=False, **spawn_kwargs())
+                data = _loads(p.stdout or b"{}")
+                if p.returncode != 0 and not data.get("streams"):
+                    raise RuntimeError(p.stderr.decode("utf-8", "replace").strip()
+                                       or f"ffprobe exited with code {p.returncode}")
+                if p.returncode == 0 and cache_key:
+                    self._probe_cache.put(cache_key, data)
+            except Exception as e:
+                self.log_updated.emit(f"Probe failed for {base_name}: {e}")
+                data = {}
+
+        streams = data.get("streams", [])
+        audio_streams = [AudioStream.from_probe(s) for s in streams if s.get("codec_type") == "audio"]
+        video_info = next((s for s in streams if s.get("codec_type") == "video"), {})
         try:
-            p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                               text=True, check=True, encoding="utf-8", errors="replace")
-            data = json.loads(p.stdout or "{}")
-            streams = data.get("streams", [])
-            return streams[0] if streams else {}
-        except Exception as e:
-            self.log_updated.emit(f"Video probe failed for {os.path.basename(file_path)}: {e}")
-            return {}
+            duration_s = float(data.get("format", {}).get("duration"))
+        except (TypeError, ValueError):
+            self.log_updated.emit(f"Could not read duration for {base_name}. Falling back to 1 hour.")
+            duration_s = 3600.0
+        return audio_streams, video_info, duration_s
 
     def is_high_bit_depth(self, pix_fmt, profile):
         s1 = (pix_fmt or "").lower()
@@ -128,325 +591,535 @@ class AudioConverterThread(QThread):
             high = True
         return high
 
-    def get_duration_seconds(self, file_path):
-        cmd = ["ffprobe","-v","error","-show_entries","format=duration",
-               "-of","default=nw=1:nk=1", file_path]
-        try:
-            out = subprocess.check_output(cmd, text=True, encoding="utf-8", errors="replace").strip()
-            return float(out)
-        except Exception as e:
-            self.log_updated.emit(f"Could not read duration for {os.path.basename(file_path)}. Falling back to 1 hour. Error: {e}")
-            return 3600.0
+    def can_copy_audio(self, stream, channels, sample_rate, target_bps):
+        """
+        True when an input audio stream already matches the AAC settings (codec, channels,
+        sample rate, bitrate within ±10%), so it can be stream-copied instead of re-encoded.
+        """
+        if stream.codec != "aac" or stream.channels != channels or stream.sample_rate != sample_rate:
+            return False
+        if target_bps <= 0:
+            return True
+        return stream.bit_rate is not None and abs(stream.bit_rate - target_bps) <= 0.1 * target_bps
 
     def get_output_audio_bitrates(self, file_path):
-        cmd = ["ffprobe","-v","error","-select_streams","a",
-               "-show_entries","stream=index,bit_rate,codec_name,channels",
+        cmd = [self._ffprobe,"-v","error","-select_streams","a",
+               "-show_entries","stream=index,bit_rate,codec_name,channels,sample_rate",
                "-of","json", file_path]
         try:
-            out = subprocess.check_output(cmd, text=True, encoding="utf-8", errors="replace")
-            data = json.loads(out or "{}")
-            rates = []
-            for st in data.get("streams", []):
-                try:
-                    br = int(st.get("bit_rate")) if st.get("bit_rate") is not None else None
-                except Exception:
-                    br = None
-                rates.append({"index": st.get("index"),
-                              "bit_rate": br,
-                              "codec": st.get("codec_name"),
-                              "channels": st.get("channels")})
-            return rates
+            out = subprocess.check_output(cmd, **spawn_kwargs())
+            data = _loads(out or b"{}")
+            return [AudioStream.from_probe(st) for st in data.get("streams", [])]
         except Exception as e:
             self.log_updated.emit(f"Could not read output audio bitrates for {os.path.basename(file_path)}: {e}")
             return []
 
-    def _emit_overall(self, file_index_zero_based, file_progress_0to1, total_files):
-        overall = int(((file_index_zero_based + file_progress_0to1) / max(total_files, 1)) * 100)
+    def _watch_output(self, output_path):
+        """
+        inotify watch on the output directory so the size fallback only stats the file after
+        ffmpeg modified it. Returns None (plain polling) without inotify_simple or on failure.
+        """
+        if INotify is None or not USE_SELECTORS:
+            return None
+        try:
+            watch = INotify()
+            watch.add_watch(os.path.dirname(os.path.abspath(output_path)),
+                            inotify_flags.MODIFY | inotify_flags.CREATE)
+            return watch
+        except Exception:
+            return None
+
+    def _set_file_fraction(self, file_index_zero_based, file_progress_0to1, total_files):
+        with self._progress_lock:
+            self._file_fractions[file_index_zero_based] = file_progress_0to1
+            done = sum(self._file_fractions.values())
+        overall = int((done / max(total_files, 1)) * 100)
         self.overall_progress_updated.emit(overall)
 
+    def _file_started(self, file_index_zero_based, base_name, total_files):
+        # The GUI shows a single "current file"; with parallel jobs that is the most recently started one.
+        with self._progress_lock:
+            self._active[file_index_zero_based] = base_name
+            self._current = file_index_zero_based
+        self.current_file_changed.emit(base_name, file_index_zero_based + 1, total_files)
+
+    def _file_finished(self, file_index_zero_based, total_files):
+        switch_to = None
+        with self._progress_lock:
+            self._active.pop(file_index_zero_based, None)
+            if self._current == file_index_zero_based:
+                self._current = next(reversed(list(self._active)), None)
+                if self._current is not None:
+                    switch_to = (self._active[self._current], self._current + 1)
+        if switch_to:
+            self.current_file_changed.emit(switch_to[0], switch_to[1], total_files)
+
+    def _is_current(self, file_index_zero_based):
+        with self._progress_lock:
+            return self._current == file_index_zero_based
+
     def stop(self):
         self._is_running = False
-        try:
-            if self.isRunning():
-                self.wait(1000)
-        except Exception:
-            pass
+        with self._wake_lock:
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"x")
+                except OSError:
+                    pass
 
     # ---------- main worker ----------
     def run(self):
         try:
             total_files = len(self.files)
+            os.makedirs(self.output_dir, exist_ok=True)
+            if self._probe_cache.error:
+                self.log_updated.emit(f"Probe cache disabled: {self._probe_cache.error}")
+            # no more workers than files, so a short queue still gets the whole thread budget
+            jobs = max(1, min(int(self.config.get("parallel_jobs") or default_parallel_jobs()), total_files))
+            # split the cores between concurrent ffmpeg processes so they don't oversubscribe the CPU;
+            # config["ffmpeg_threads"] overrides the per-process budget
+            self._threads_per_job = (int(self.config.get("ffmpeg_threads") or 0)
+                                     or max(1, (os.cpu_count() or 1) // jobs))
+            if jobs > 1:
+                self.log_updated.emit(f"Running up to {jobs} conversions in parallel "
+                                      f"({self._threads_per_job} thread(s) each).")
+
+            # Two stages: one setup thread probes files and builds their commands while
+            # the encode workers run ffmpeg, so probing file N+1 overlaps encoding file N.
+            exec_q = queue.Queue(maxsize=PREPARE_AHEAD)
+            with ThreadPoolExecutor(max_workers=jobs + 1) as ex:
+                setup = ex.submit(self._prepare_all, exec_q, jobs)
+                encoders = [ex.submit(self._encode_worker, exec_q, total_files) for _ in range(jobs)]
+                failed = setup.result() + sum(f.result() for f in encoders)
 
+            if self._is_running:
+                if failed:
+                    self.log_updated.emit(f"{failed} of {total_files} file(s) failed.")
+                self.conversion_complete.emit()
+
+        except Exception as e:
+            self.error_occurred.emit(f"An unexpected error occurred: {str(e)}")
+        finally:
+            self._probe_cache.close()
+            with self._wake_lock:
+                for fd in (self._wake_r, self._wake_w):
+                    if fd is not None:
+                        os.close(fd)
+                self._wake_r = self._wake_w = None
+
+    def _prepare_all(self, exec_q, jobs):
+        """
+        Setup stage: prepare every file in order and hand the tasks to the
+        encode workers through exec_q (bounded, so it only runs PREPARE_AHEAD
+        files ahead). The probes for the whole queue are started up front on
+        a small pool, so they overlap each other instead of running one by one.
+        Returns the number of files that failed here.
+        """
+        failed = 0
+        probes = []
+        probe_pool = ThreadPoolExecutor(max_workers=max(1, min(PROBE_WORKERS, len(self.files))))
+        try:
+            probes = [probe_pool.submit(self.probe_all, filename) for filename in self.files]
             for i, filename in enumerate(self.files):
                 if not self._is_running:
                     break
-
-                input_path = filename
-                base_name = os.path.basename(filename)
-
-                os.makedirs(self.output_dir, exist_ok=True)
-                output_path = os.path.join(self.output_dir, base_name)
-
-                self.current_file_changed.emit(base_name, i + 1, total_files)
-                self.log_updated.emit(f"Processing {base_name}...")
-
-                audio_streams = self.get_audio_stream_metadata(input_path)
-                video_info = self.get_video_info(input_path)
-                duration_s = self.get_duration_seconds(input_path)
-
-                # audio stream count for size-based estimate if needed
-                assumed_count = len(audio_streams) if audio_streams else 1
-                if not audio_streams:
-                    self.log_updated.emit(f"Proceeding without probe for {base_name}: assuming {assumed_count} audio stream(s).")
-
-                # Build command
-                ffmpeg_cmd = ["ffmpeg", "-y", "-nostdin", "-hide_banner",
-                              "-progress", "pipe:1", "-nostats", "-loglevel", "error",
-                              "-i", input_path,
-                              "-map", "0"]
-
-                # ---- VIDEO handling (Jellyfin-friendly) ----
-                selected_v = self.config["video_codec"]
-                force_8bit = bool(self.config.get("force_8bit"))
-                pix_fmt = video_info.get("pix_fmt")
-                profile = video_info.get("profile")
-                need_8bit = self.is_high_bit_depth(pix_fmt, profile)
-
-                if force_8bit or (selected_v == "copy" and need_8bit):
-                    # Auto-upgrade to libx264 8-bit High@4.1 for compatibility
-                    self.log_updated.emit(f"Video is high bit-depth ({pix_fmt or 'unknown'}/{profile or 'unknown'}). Transcoding to 8‑bit H.264 for Direct Play.")
-                    selected_v = "libx264"
-
-                ffmpeg_cmd.extend(["-c:v", selected_v])
-
-                if selected_v == "libx264":
-                    crf = str(self.config.get("x264_crf", 18))
-                    preset = str(self.config.get("x264_preset", "slow"))
-                    ffmpeg_cmd.extend(["-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.1",
-                                       "-crf", crf, "-preset", preset])
-                    # ensure format during filter graph too (safer for odd inputs)
-                    ffmpeg_cmd.extend(["-vf", "format=yuv420p"])
-                elif selected_v == "libx265":
-                    # still force 8-bit unless you have 10-bit build; 8-bit is most compatible
-                    ffmpeg_cmd.extend(["-pix_fmt", "yuv420p"])
-
-                # ---- SUBS/ATTACHMENTS/DATA ----
-                ffmpeg_cmd.extend(["-c:s", self.config["subtitle_codec"]])
-                ffmpeg_cmd.extend(["-c:t", "copy", "-c:d", "copy"])
-
-                # ---- AUDIO handling ----
-                a_bitrate = self.config["bitrate"]
-                a_channels = int(self.config["channels"])
-                a_rate = int(self.config["samplerate"])
-
-                if audio_streams:
-                    for idx, _ in enumerate(audio_streams):
-                        ffmpeg_cmd.extend([
-                            f"-c:a:{idx}", "aac",
-                            f"-b:a:{idx}", a_bitrate,
-                            f"-ac:a:{idx}", str(a_channels),
-                            f"-ar:a:{idx}", str(a_rate),
-                        ])
+                task = self._prepare(i, filename, probes[i])
+                if task is None:
+                    failed += 1
+                    self._set_file_fraction(i, 1.0, len(self.files))  # failed counts as done
                 else:
-                    ffmpeg_cmd.extend(["-c:a", "aac", "-b:a", a_bitrate, "-ac", str(a_channels), "-ar", str(a_rate)])
-
-                ffmpeg_cmd.extend(["-aac_coder", "twoloop"])
+                    exec_q.put(task)
+        finally:
+            for fut in probes:
+                fut.cancel()  # only affects probes not started yet (cancelled run)
+            # the few running probes still use the probe cache, which run() closes next
+            probe_pool.shutdown(wait=True)
+            for _ in range(jobs):
+                exec_q.put(None)  # one stop marker per encode worker
+        return failed
+
+    def _encode_worker(self, exec_q, total_files):
+        """
+        Encode stage: run prepared tasks until the stop marker arrives.
+        Returns the number of files that failed.
+        """
+        failed = 0
+        while True:
+            task = exec_q.get()
+            if task is None:
+                return failed
+            if self._execute(task, total_files)["status"] == "error":
+                failed += 1
+
+    def _prepare(self, i, filename, probe):
+        """
+        Build one file's ffmpeg command from its probe (a Future of probe_all()).
+        Returns a PipelineTask, or None if the file could not be prepared (already reported).
+        """
+        input_path = filename
+        base_name = os.path.basename(filename)
+        output_path = os.path.join(self.output_dir, base_name)
 
-                if self.config.get("metadata_title"):
-                    ffmpeg_cmd.extend(["-metadata:s:a", f"title={self.config['metadata_title']}"])
+        self.log_updated.emit(f"Processing {base_name}...")
 
-                ffmpeg_cmd.append(output_path)
+        try:
+            audio_streams, video_info, duration_s = probe.result()
+
+            # audio stream count for size-based estimate if needed
+            assumed_count = len(audio_streams) if audio_streams else 1
+            if not audio_streams:
+                self.log_updated.emit(f"Proceeding without probe for {base_name}: assuming {assumed_count} audio stream(s).")
+
+            # Build command
+            threads = str(self._threads_per_job)
+            # simple filtergraphs (audio resample/downmix for -ac/-ar, video format conversion)
+            # get this job's share of the cores too; -threads 0 would oversubscribe parallel jobs
+            global_args = ["-filter_threads", threads]
+            video_args = []
+
+            # ---- VIDEO handling (Jellyfin-friendly) ----
+            selected_v = self.config["video_codec"]
+            force_8bit = bool(self.config.get("force_8bit"))
+            pix_fmt = video_info.get("pix_fmt")
+            profile = video_info.get("profile")
+            need_8bit = self.is_high_bit_depth(pix_fmt, profile)
+
+            if need_8bit and is_hw_encoder(selected_v):
+                # hardware encoders below always output 8-bit 4:2:0
+                self.log_updated.emit(f"Video is high bit-depth ({pix_fmt or 'unknown'}/{profile or 'unknown'}). Encoding to 8‑bit with {selected_v}.")
+            elif need_8bit and (force_8bit or selected_v == "copy"):
+                # Auto-upgrade to libx264 8-bit High@4.1 for compatibility
+                self.log_updated.emit(f"Video is high bit-depth ({pix_fmt or 'unknown'}/{profile or 'unknown'}). Transcoding to 8‑bit H.264 for Direct Play.")
+                selected_v = "libx264"
+            elif force_8bit and video_info:
+                # already 8-bit: nothing to convert, keep the selected codec (usually a fast copy)
+                self.log_updated.emit(f"Video is already 8-bit ({pix_fmt or 'unknown'}); keeping video codec '{selected_v}'.")
+
+            # "copy" passes video through untouched: no -pix_fmt/-vf there, either would force a re-encode
+            video_args.extend(["-c:v", selected_v, "-threads", threads])  # encoder threads
+
+            if selected_v == "libx264":
+                crf = str(self.config.get("x264_crf", 18))
+                preset = str(self.config.get("x264_preset", "slow"))
+                # frame threading (no sliced threads) scales better with many cores
+                video_args.extend(["-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.1",
+                                   "-crf", crf, "-preset", preset,
+                                   "-x264-params", f"threads={threads}:sliced-threads=0"])
+                # ensure format during filter graph too (safer for odd inputs)
+                video_args.extend(["-vf", "format=yuv420p"])
+            elif selected_v == "libx265":
+                frame_threads = max(1, min(16, self._threads_per_job // 2))
+                # still force 8-bit unless you have 10-bit build; 8-bit is most compatible
+                video_args.extend(["-pix_fmt", "yuv420p",
+                                   "-x265-params", f"pools={threads}:frame-threads={frame_threads}"])
+            elif is_hw_encoder(selected_v):
+                # x264 CRF doubles as the constant-quality level; preset is x264-only
+                video_args.extend(hw_encoder_args(selected_v, self.config.get("x264_crf", 18)))
+                global_args.extend(hw_input_args(selected_v))
+
+            # Only a video transcode has a decoder worth threading; for copy/audio-only jobs
+            # pin input threads to 1 so libavcodec doesn't spin up pools that fight the encoders.
+            in_threads = threads if selected_v != "copy" else "1"
+            ffmpeg_cmd = [*self._base_cmd_prefix, *global_args,
+                          "-threads", in_threads,  # decoder threads
+                          "-i", input_path,
+                          "-map", "0",
+                          *video_args]
+
+            # ---- SUBS/ATTACHMENTS/DATA ----
+            ffmpeg_cmd += self._subs_data_args
+
+            # ---- AUDIO handling ----
+            a_codec, a_bitrate, a_channels_s, a_rate_s = self._a_args_template
+            a_channels, a_rate, a_target_bps = self._a_channels, self._a_rate, self._a_target_bps
+
+            if audio_streams:
+                for idx, st in enumerate(audio_streams):
+                    if self.can_copy_audio(st, a_channels, a_rate, a_target_bps):
+                        # already what we would produce: remux instead of decode + encode
+                        self.log_updated.emit(f"Audio stream {idx} of {base_name} is already AAC "
+                                              f"{a_channels}ch @ {a_rate} Hz; copying it.")
+                        ffmpeg_cmd += (f"-c:a:{idx}", "copy")
+                        continue
+                    ffmpeg_cmd += (f"-c:a:{idx}", a_codec, f"-b:a:{idx}", a_bitrate,
+                                   f"-ac:a:{idx}", a_channels_s, f"-ar:a:{idx}", a_rate_s)
+            else:
+                ffmpeg_cmd += ("-c:a", a_codec, "-b:a", a_bitrate, "-ac", a_channels_s, "-ar", a_rate_s)
+
+            ffmpeg_cmd += self._out_tail_args
+            ffmpeg_cmd.append(output_path)
+
+            # target bitrate for fallback size-based progress
+            target_bps = a_target_bps * max(assumed_count, 1)
+            if target_bps <= 0:
+                target_bps = 192000 * max(assumed_count, 1)
+
+            return PipelineTask(i, base_name, output_path, ffmpeg_cmd, duration_s, target_bps)
 
-                try:
-                    try:
-                        cmd_str = shlex.join(ffmpeg_cmd)
-                    except Exception:
-                        cmd_str = " ".join(ffmpeg_cmd)
-                    self.log_updated.emit(f"Executing: {cmd_str}")
-
-                    creationflags = 0x08000000 if os.name == "nt" else 0  # CREATE_NO_WINDOW
-                    process = subprocess.Popen(
-                        ffmpeg_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        encoding="utf-8",
-                        errors="replace",
-                        bufsize=1,
-                        universal_newlines=True,
-                        creationflags=creationflags
-                    )
-
-                    t = threading.Thread(target=self._drain_stderr, args=(process.stderr,), daemon=True)
-                    t.start()
-
-                    start_wall = time.time()
-                    last_out_time = 0.0
-                    total_size_bytes = 0
-                    speed_x = 0.0
-                    have_time = False
-                    last_poll = 0.0
-
-                    # target bitrate for fallback size-based progress
-                    target_bps = parse_bitrate_to_bps(self.config["bitrate"]) * max(assumed_count, 1)
-                    if target_bps <= 0:
-                        target_bps = 192000 * max(assumed_count, 1)
-
-                    # start in indeterminate mode until we glean something
-                    self.file_progress_updated.emit(-1)
-                    self.eta_updated.emit("calculating…")
-
-                    while True:
-                        if not self._is_running:
-                            process.terminate()
-                            break
-
-                        line = process.stdout.readline()
-                        if not line and process.poll() is not None:
-                            break
-
-                        if line:
-                            s = line.strip()
-                            if s and "=" in s:
-                                key, value = s.split("=", 1)
-                                key = key.strip()
-                                value = value.strip()
-
-                                if key == "out_time_ms":
-                                    try:
-                                        out_time_s = int(value) / 1_000_000.0
-                                        if out_time_s >= 0:
-                                            last_out_time = min(out_time_s, duration_s)
-                                            have_time = True
-                                    except Exception:
-                                        pass
-                                elif key == "out_time":
-                                    try:
-                                        h, m, sec = value.split(":")
-                                        out_time_s = int(h) * 3600 + int(m) * 60 + float(sec)
-                                        last_out_time = min(out_time_s, duration_s)
-                                        have_time = True
-                                    except Exception:
-                                        pass
-                                elif key == "total_size":
-                                    try:
-                                        total_size_bytes = int(value)
-                                    except Exception:
-                                        pass
-                                elif key == "speed":
-                                    try:
-                                        v = value.strip().lower().rstrip('x')
-                                        speed_x = float(v)
-                                    except Exception:
-                                        speed_x = 0.0
-
-                        # Poll actual on-disk file size as an extra fallback
-                        now = time.time()
-                        if (now - last_poll) > 0.25:
-                            last_poll = now
-                            try:
-                                if os.path.exists(output_path):
-                                    actual = os.path.getsize(output_path)
-                                    if actual > total_size_bytes:
-                                        total_size_bytes = actual
-                            except Exception:
-                                pass
-
-                        # Compute progress
-                        estimable = False
-                        if have_time and duration_s > 0:
-                            file_progress = last_out_time / duration_s
-                            estimable = True
-                        elif total_size_bytes > 0 and target_bps > 0 and duration_s > 0:
-                            est_processed_s = (total_size_bytes * 8.0) / target_bps
-                            file_progress = min(max(est_processed_s / duration_s, 0.0), 0.99)
-                            estimable = True
-                        elif speed_x > 0 and duration_s > 0:
-                            elapsed = max(now - start_wall, 0.0)
-                            est_processed_s = elapsed * speed_x
-                            file_progress = min(max(est_processed_s / duration_s, 0.0), 0.99)
-                            estimable = True
+        except Exception as e:
+            error_msg = f"Error processing {base_name}: {str(e)}"
+            self.log_updated.emit(error_msg)
+            self.error_occurred.emit(error_msg)
+            return None
 
-                        if estimable:
-                            pct = int(max(0.0, min(file_progress, 1.0)) * 100)
-                            self.file_progress_updated.emit(pct)
+    def _execute(self, task, total_files):
+        """
+        Run one prepared task. Returns a result dict with its status
+        ("ok", "error" or "cancelled").
+        """
+        i = task.index
+        base_name = task.name
+        output_path = task.output_path
+        duration_s = task.duration_s
+        target_bps = task.target_bps
+        ffmpeg_cmd = task.cmd
+        result = {"status": "cancelled"}
+        if not self._is_running:
+            return result
+
+        self._file_started(i, base_name, total_files)
 
-                            # ETA
-                            if have_time:
-                                remaining = max(duration_s - last_out_time, 0.0)
-                            elif total_size_bytes > 0 and target_bps > 0:
-                                est_processed_s = (total_size_bytes * 8.0) / target_bps
-                                remaining = max(duration_s - est_processed_s, 0.0)
-                            else:
-                                elapsed = max(now - start_wall, 0.0)
-                                est_processed_s = elapsed * max(speed_x, 1e-6)
-                                remaining = max(duration_s - est_processed_s, 0.0)
-
-                            eta_seconds = int(remaining)
-                            eta_mm, eta_ss = divmod(eta_seconds, 60)
-                            self.eta_updated.emit(f"{eta_mm:02d}:{eta_ss:02d} remaining")
+        try:
+            if self.config.get("log_commands", True):
+                self.log_updated.emit(f"Executing: {shlex.join(ffmpeg_cmd)}")
+
+            out_watch = self._watch_output(output_path)
+            out_name = os.fsencode(os.path.basename(output_path))
+            size_dirty = True
+            out_fd = None      # output opened once for fstat(), instead of a path lookup per poll
+            polled_size = 0
+
+            process = subprocess.Popen(
+                ffmpeg_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,  # PipeReader reads the raw fds, so a Python-side buffer would never be used
+                **spawn_kwargs()
+            )
+            read_size = max(enlarge_pipe(process.stdout), enlarge_pipe(process.stderr), READ_CHUNK)
+
+            start_wall = time.monotonic()
+            prog = ProgressState()
+            # partial lines carried between reads; bytearrays grow in place instead of
+            # re-copying the whole tail on every chunk
+            pending = bytearray()
+            pending_log = bytearray()
+            # stderr is consumed as it arrives, so keep its tail for the error message
+            err_tail = deque(maxlen=ERROR_TAIL_LINES)
+
+            # start in indeterminate mode until we glean something
+            if self._is_current(i):
+                self.file_progress_updated.emit(-1)
+                self.eta_updated.emit("calculating…")
+
+            reader = PipeReader({"progress": process.stdout, "log": process.stderr},
+                                wake_fd=self._wake_r, read_size=read_size)
+            if out_watch is not None:
+                reader.watch("output", out_watch)
+            next_poll = time.monotonic()
+            last_emit = 0.0
+            speed_ema = 0.0
+            # last values sent to the GUI (-1: the indeterminate state sent above); None forces a send
+            last_pct, last_eta_s = -1, None
+            # per-file constants for the progress math below
+            inv_duration = 1.0 / duration_s if duration_s > 0 else 0.0
+            bytes_to_s = 8.0 / target_bps if target_bps > 0 else 0.0  # output bytes -> media seconds
+            while reader.open:
+                if not self._is_running:
+                    process.terminate()
+                    break
 
-                            # Overall
-                            self._emit_overall(i, min(max(file_progress, 0.0), 1.0), total_files)
-                        else:
-                            # keep indeterminate
-                            self.file_progress_updated.emit(-1)
-                            self.eta_updated.emit("calculating…")
-
-                        if not line:
-                            time.sleep(0.05)
-
-                    process.wait()
-
-                    if not self._is_running:
-                        self.log_updated.emit(f"Conversion of {base_name} cancelled.")
-                        if os.path.exists(output_path):
-                            try:
-                                os.remove(output_path)
-                            except Exception:
-                                pass
-                    elif process.returncode != 0:
-                        try:
-                            error_msg = process.stderr.read() if process.stderr else "Unknown FFmpeg error"
-                        except Exception:
-                            error_msg = "Unknown FFmpeg error"
-                        msg = f"Error processing {base_name}.\nFFmpeg error: {error_msg}"
-                        self.log_updated.emit(msg)
-                        self.error_occurred.emit(msg)
-                        if os.path.exists(output_path):
-                            try:
-                                os.remove(output_path)
-                            except Exception:
-                                pass
+                # sleeps until ffmpeg writes or stop() wakes us; the on-disk size is only a fallback
+                # while ffmpeg reports neither out_time nor total_size, so that is the only time the
+                # size-poll heartbeat is needed (apart from Windows, which has no wake pipe)
+                need_size = not (prog.have_time or prog.total_size)
+                if not need_size and self._wake_r is not None:
+                    timeout = None
+                else:
+                    timeout = max(next_poll - time.monotonic(), 0.0)
+                events = reader.read(timeout)
+                got_progress = False
+                for source, chunk in events:
+                    if source == "output":
+                        if any(os.fsencode(ev.name) == out_name for ev in parse_inotify_events(chunk)):
+                            size_dirty = True
+                    elif source == "log":
+                        pending_log += chunk
+                        cut = pending_log.rfind(b"\n") + 1
+                        if cut:
+                            err_tail.extend(self._emit_log_lines(pending_log[:cut].split(b"\n")))
+                            del pending_log[:cut]
                     else:
-                        rates = self.get_output_audio_bitrates(output_path)
-                        if rates:
-                            for r in rates:
-                                br = r.get('bit_rate')
-                                br_txt = f"{br//1000}k" if isinstance(br, int) else "unknown"
-                                self.log_updated.emit(
-                                    f"Output audio stream {r.get('index')} -> {r.get('codec')} "
-                                    f"{r.get('channels')}ch @ {br_txt}"
-                                )
-                        self.log_updated.emit(f"Successfully converted {base_name}")
-                        self.file_progress_updated.emit(100)
-                        self._emit_overall(i, 1.0, total_files)
-
-                except Exception as e:
-                    error_msg = f"Error processing {base_name}: {str(e)}"
-                    self.log_updated.emit(error_msg)
-                    self.error_occurred.emit(error_msg)
-                    if os.path.exists(output_path):
+                        pending += chunk
+                        got_progress = True
+                if got_progress:
+                    cut = pending.rfind(b"\n") + 1
+                    if cut:
+                        complete = bytes(pending[:cut])  # bytes: the keys index PROGRESS_HANDLERS
+                        del pending[:cut]
+                        for key, value in _PROG_RE.findall(complete):
+                            PROGRESS_HANDLERS[key](prog, value)
+                    need_size = not (prog.have_time or prog.total_size)
+                    if out_watch is not None and not need_size:
+                        # ffmpeg's own numbers drive progress from here on: stop waking up on every write
+                        reader.unwatch(out_watch)
+                        out_watch.close()
+                        out_watch = None
+
+                # Poll actual on-disk file size as an extra fallback, on a fixed cadence
+                # (with an inotify watch: only if ffmpeg wrote to it since the last poll)
+                now = time.monotonic()
+                polled = now >= next_poll
+                if polled:
+                    next_poll = now + POLL_INTERVAL
+                if polled and need_size and (size_dirty or out_watch is None):
+                    size_dirty = False
+                    if out_fd is None:
+                        try:
+                            out_fd = os.open(output_path, os.O_RDONLY)
+                        except OSError:
+                            pass  # not created yet
+                    if out_fd is not None:
                         try:
-                            os.remove(output_path)
-                        except Exception:
+                            polled_size = os.fstat(out_fd).st_size
+                        except OSError:
                             pass
 
-            if self._is_running:
-                self.conversion_complete.emit()
+                if not (got_progress or polled):
+                    continue
+                if prog.ended:
+                    # progress=end: all input consumed, only the trailer is left to write
+                    last_out_time = duration_s
+                    have_time = True
+                else:
+                    last_out_time = min(prog.out_time, duration_s)
+                    have_time = prog.have_time
+                total_size_bytes = prog.total_size or polled_size
+                speed_x = prog.speed
+
+                if got_progress and speed_x > 0:
+                    speed_ema = speed_x if speed_ema <= 0 else speed_ema + SPEED_EMA_ALPHA * (speed_x - speed_ema)
+
+                # coalesce GUI updates to at most 1 / EMIT_INTERVAL per worker
+                if now - last_emit < EMIT_INTERVAL:
+                    continue
+                last_emit = now
+
+                # Compute progress
+                estimable = False
+                if have_time and duration_s > 0:
+                    file_progress = last_out_time * inv_duration
+                    estimable = True
+                elif total_size_bytes > 0 and target_bps > 0 and duration_s > 0:
+                    est_processed_s = total_size_bytes * bytes_to_s
+                    file_progress = min(max(est_processed_s * inv_duration, 0.0), 0.99)
+                    estimable = True
+                elif speed_x > 0 and duration_s > 0:
+                    elapsed = max(now - start_wall, 0.0)
+                    est_processed_s = elapsed * speed_x
+                    file_progress = min(max(est_processed_s * inv_duration, 0.0), 0.99)
+                    estimable = True
+
+                is_current = self._is_current(i)
+                if not is_current:
+                    # the GUI shows another file now; resend everything once this one is current again
+                    last_pct = last_eta_s = None
+                if estimable:
+                    if is_current:
+                        pct = int(max(0.0, min(file_progress, 1.0)) * 100)
+                        if pct != last_pct:
+                            last_pct = pct
+                            self.file_progress_updated.emit(pct)
+
+                        # ETA
+                        if have_time:
+                            remaining = max(duration_s - last_out_time, 0.0)
+                        elif total_size_bytes > 0 and target_bps > 0:
+                            est_processed_s = total_size_bytes * bytes_to_s
+                            remaining = max(duration_s - est_processed_s, 0.0)
+                        else:
+                            elapsed = max(now - start_wall, 0.0)
+                            est_processed_s = elapsed * max(speed_x, 1e-6)
+                            remaining = max(duration_s - est_processed_s, 0.0)
+                        # media seconds left -> wall-clock seconds at the (smoothed) encode speed
+                        if speed_ema > 0:
+                            remaining /= speed_ema
+
+                        eta_seconds = int(remaining)
+                        if eta_seconds != last_eta_s:  # changes at most once per second
+                            last_eta_s = eta_seconds
+                            eta_mm, eta_ss = divmod(eta_seconds, 60)
+                            self.eta_updated.emit(f"{eta_mm:02d}:{eta_ss:02d} remaining")
+
+                    # Overall
+                    self._set_file_fraction(i, min(max(file_progress, 0.0), 1.0), total_files)
+                elif is_current:
+                    # keep indeterminate
+                    if last_pct != -1:
+                        last_pct, last_eta_s = -1, None
+                        self.file_progress_updated.emit(-1)
+                        self.eta_updated.emit("calculating…")
+
+            reader.close()
+            err_tail.extend(self._emit_log_lines([pending_log]))
+            if out_watch is not None:
+                out_watch.close()
+            if out_fd is not None:
+                os.close(out_fd)  # before a cancelled/failed output gets removed (Windows)
+            process.wait()
+
+            if not self._is_running:
+                self.log_updated.emit(f"Conversion of {base_name} cancelled.")
+                if os.path.exists(output_path):
+                    try:
+                        os.remove(output_path)
+                    except Exception:
+                        pass
+            elif process.returncode != 0:
+                error_msg = "\n".join(err_tail) or f"Unknown FFmpeg error (exit code {process.returncode})"
+                msg = f"Error processing {base_name}.\nFFmpeg error: {error_msg}"
+                self.log_updated.emit(msg)
+                self.error_occurred.emit(msg)
+                result["status"] = "error"
+                self._set_file_fraction(i, 1.0, total_files)  # failed counts as done
+                if os.path.exists(output_path):
+                    try:
+                        os.remove(output_path)
+                    except Exception:
+                        pass
+            else:
+                rates = self.get_output_audio_bitrates(output_path)
+                if rates:
+                    for r in rates:
+                        br_txt = f"{r.bit_rate//1000}k" if r.bit_rate is not None else "unknown"
+                        self.log_updated.emit(
+                            f"Output audio stream {r.index} -> {r.codec} "
+                            f"{r.channels}ch @ {br_txt}"
+                        )
+                if self.config.get("drop_cache_after", True):
+                    drop_page_cache(output_path)
+                self.log_updated.emit(f"Successfully converted {base_name}")
+                if self._is_current(i):
+                    self.file_progress_updated.emit(100)
+                self._set_file_fraction(i, 1.0, total_files)
+                result["status"] = "ok"
 
         except Exception as e:
-            self.error_occurred.emit(f"An unexpected error occurred: {str(e)}")
+            error_msg = f"Error processing {base_name}: {str(e)}"
+            self.log_updated.emit(error_msg)
+            self.error_occurred.emit(error_msg)
+            result["status"] = "error"
+            self._set_file_fraction(i, 1.0, total_files)
+            if os.path.exists(output_path):
+                try:
+                    os.remove(output_path)
+                except Exception:
+                    pass
+
+        finally:
+            self._file_finished(i, total_files)
+
+        return result
 
 
 class AudioNormalizationApp(QMainWindow):
@@ -466,12 +1139,30 @@ class AudioNormalizationApp(QMainWindow):
             "force_8bit": True,   # Default ON for Jellyfin users
             "x264_crf": 18,
             "x264_preset": "slow",
+            "parallel_jobs": default_parallel_jobs(),
+            "ffmpeg_threads": 0,  # 0 = split the cores evenly between parallel jobs
+            "log_commands": True,
+            "drop_cache_after": True,
         }
 
         self.selected_files = []
         self.converter_thread = None
+        self._scan_task = None
+        self._hw_task = None
+
+        # Latest values from the worker; applied by _flush_pending at most
+        # once per GUI_REFRESH_MS instead of once per signal.
+        self._pending_overall = None
+        self._pending_file = None
+        self._pending_eta = None
+        self._pending_log = deque(maxlen=LOG_MAX_BLOCKS)  # anything older would be trimmed by the widget anyway
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(GUI_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self._flush_pending)
 
         self.setup_ui()
+        self._bind_config_widgets()
         self.check_ffmpeg_availability()
 
     def setup_ui(self):
@@ -494,11 +1185,16 @@ class AudioNormalizationApp(QMainWindow):
         btn_row.addWidget(self.select_file_btn)
         btn_row.addWidget(self.select_dir_btn)
         self.files_label = QLabel("No files selected")
-        self.files_label.setWordWrap(True)
-        self.files_label.setMinimumHeight(50)
-        self.files_label.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc;")
+        # model/view: only the visible rows are laid out, however many files are selected
+        self.files_model = QStringListModel()
+        self.files_view = QListView()
+        self.files_view.setModel(self.files_model)
+        self.files_view.setUniformItemSizes(True)
+        self.files_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.files_view.setMinimumHeight(80)
         file_layout.addLayout(btn_row)
         file_layout.addWidget(self.files_label)
+        file_layout.addWidget(self.files_view)
         file_group.setLayout(file_layout)
 
         config_group = QGroupBox("Configuration")
@@ -582,6 +1278,25 @@ class AudioNormalizationApp(QMainWindow):
         preset_col.addWidget(self.preset_combo)
         video_row2.addLayout(preset_col)
 
+        jobs_col = QVBoxLayout()
+        jobs_col.addWidget(QLabel("Parallel jobs:"))
+        self.jobs_spin = QSpinBox()
+        self.jobs_spin.setRange(1, os.cpu_count() or 1)
+        self.jobs_spin.setValue(self.config["parallel_jobs"])
+        self.jobs_spin.setToolTip("Number of files encoded at the same time (one ffmpeg process each)")
+        jobs_col.addWidget(self.jobs_spin)
+        video_row2.addLayout(jobs_col)
+
+        threads_col = QVBoxLayout()
+        threads_col.addWidget(QLabel("Threads per job:"))
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, os.cpu_count() or 1)
+        self.threads_spin.setSpecialValueText("Auto")  # shown for 0
+        self.threads_spin.setValue(self.config["ffmpeg_threads"])
+        self.threads_spin.setToolTip("Threads each ffmpeg process may use; Auto splits the CPU cores between parallel jobs")
+        threads_col.addWidget(self.threads_spin)
+        video_row2.addLayout(threads_col)
+
         config_layout.addLayout(video_row2)
 
         config_group.setLayout(config_layout)
@@ -597,6 +1312,9 @@ class AudioNormalizationApp(QMainWindow):
         row1.addWidget(QLabel("Current file:"))
         self.current_file_label = QLabel("--")
         self.current_file_label.setStyleSheet("font-weight: bold;")
+        # long names are elided to the label's width instead of resizing the window
+        self.current_file_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+        self._current_file_text = "--"
         row1.addWidget(self.current_file_label, 1)
         self.file_eta_label = QLabel("--:-- remaining")
         row1.addWidget(self.file_eta_label)
@@ -620,8 +1338,9 @@ class AudioNormalizationApp(QMainWindow):
         log_widget = QWidget()
         log_layout = QVBoxLayout(log_widget)
         log_layout.addWidget(QLabel("Conversion Log:"))
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_text.setFont(QFont("Courier New", 9))
         log_layout.addWidget(self.log_text)
 
@@ -648,21 +1367,62 @@ class AudioNormalizationApp(QMainWindow):
 
         self.setCentralWidget(main_widget)
 
+    def _bind_config_widgets(self):
+        """
+        Keep self.config in sync with the widgets as they change, so
+        start_conversion doesn't have to read and parse every widget.
+        """
+        bindings = (
+            (self.output_dir_edit.textChanged, "output_dir", str),
+            (self.bitrate_combo.currentTextChanged, "bitrate", str),
+            (self.channels_combo.currentTextChanged, "channels", int),
+            (self.samplerate_combo.currentTextChanged, "samplerate", int),
+            (self.video_codec_combo.currentTextChanged, "video_codec", str),
+            (self.subtitle_codec_combo.currentTextChanged, "subtitle_codec", str),
+            (self.force8_checkbox.toggled, "force_8bit", bool),
+            (self.crf_combo.currentTextChanged, "x264_crf", int),
+            (self.preset_combo.currentTextChanged, "x264_preset", str),
+            (self.jobs_spin.valueChanged, "parallel_jobs", int),
+            (self.threads_spin.valueChanged, "ffmpeg_threads", int),
+        )
+        for signal, key, convert in bindings:
+            signal.connect(partial(self._set_config, key, convert))
+
+    def _set_config(self, key, convert, value):
+        self.config[key] = convert(value)
+
     def check_ffmpeg_availability(self):
         try:
-            subprocess.run(["ffmpeg", "-version"], check=True,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            subprocess.run(["ffprobe", "-version"], check=True,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            self.log_updated("FFmpeg and FFprobe are available.")
+            ffmpeg_bin = shutil.which("ffmpeg")
+            ffprobe_bin = shutil.which("ffprobe")
+            if not ffmpeg_bin or not ffprobe_bin:
+                raise FileNotFoundError("ffmpeg/ffprobe")
+            subprocess.run([ffmpeg_bin, "-version"], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **spawn_kwargs())
+            subprocess.run([ffprobe_bin, "-version"], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **spawn_kwargs())
+            # resolved once here and handed to every converter thread via the config
+            self.config["ffmpeg_bin"] = ffmpeg_bin
+            self.config["ffprobe_bin"] = ffprobe_bin
+            self.log_updated(f"FFmpeg and FFprobe are available ({ffmpeg_bin}, {ffprobe_bin}).")
+            task = HwDetectTask(ffmpeg_bin)
+            task.signals.encoders_found.connect(self.on_hw_encoders_found)
+            self._hw_task = task  # keep the signals object alive until detection reports back
+            QThreadPool.globalInstance().start(task)
         except Exception:
             QMessageBox.critical(self, "Error",
                                  "FFmpeg or FFprobe not found. Please ensure they are installed and in your system's PATH.")
             self.convert_btn.setEnabled(False)
 
+    def on_hw_encoders_found(self, hw_encoders):
+        self._hw_task = None
+        if hw_encoders:
+            self.video_codec_combo.addItems(hw_encoders)
+            self.log_updated(f"Hardware video encoders: {', '.join(hw_encoders)}.")
+
     def select_files(self):
         files, _ = QFileDialog.getOpenFileNames(
-            self, "Select Media Files", "", "Media Files (*.mkv *.mka *.flac *.wav *.mp4 *.m4a *.mp3);;All Files (*)"
+            self, "Select Media Files", "", MEDIA_FILE_FILTER
         )
         if files:
             self.selected_files = files
@@ -671,22 +1431,42 @@ class AudioNormalizationApp(QMainWindow):
     def select_directory(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Directory")
         if directory:
-            try:
-                self.selected_files = [os.path.join(directory, f) for f in os.listdir(directory)
-                                       if os.path.splitext(f.lower())[1] in (".mkv",".mka",".flac",".wav",".mp4",".m4a",".mp3")]
-                if not self.selected_files:
-                    QMessageBox.information(self, "No Files", "No supported media files found in the selected directory.")
-                else:
-                    self.update_files_display()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error reading directory: {str(e)}")
+            self.select_dir_btn.setEnabled(False)
+            self.files_label.setText(f"Scanning {directory}…")
+            task = DirScanTask(directory)
+            task.signals.files_ready.connect(self.on_directory_scanned)
+            task.signals.scan_failed.connect(self.on_directory_scan_failed)
+            self._scan_task = task  # keep the signals object alive until the scan reports back
+            QThreadPool.globalInstance().start(task)
+
+    def _scan_finished(self):
+        self._scan_task = None
+        converting = self.converter_thread is not None and self.converter_thread.isRunning()
+        self.select_dir_btn.setEnabled(not converting)
+
+    def on_directory_scanned(self, directory, files):
+        self._scan_finished()
+        if not files:
+            self.update_files_display()
+            QMessageBox.information(self, "No Files", "No supported media files found in the selected directory.")
+        else:
+            self.selected_files = files
+            self.update_files_display()
+
+    def on_directory_scan_failed(self, directory, error):
+        self._scan_finished()
+        self.update_files_display()
+        QMessageBox.critical(self, "Error", f"Error reading directory: {error}")
 
     def update_files_display(self):
-        if len(self.selected_files) <= 5:
-            self.files_label.setText("\n".join(self.selected_files))
-        else:
-            self.files_label.setText("\n".join(self.selected_files[:5]) +
-                                     f"\n... and {len(self.selected_files) - 5} more files")
+        # setStringList is a single model reset; with updates off the view repaints once at the end
+        self.files_view.setUpdatesEnabled(False)
+        try:
+            self.files_model.setStringList(self.selected_files)
+        finally:
+            self.files_view.setUpdatesEnabled(True)
+        count = len(self.selected_files)
+        self.files_label.setText(f"{count} file(s) selected" if count else "No files selected")
 
     def browse_output_dir(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
@@ -698,31 +1478,20 @@ class AudioNormalizationApp(QMainWindow):
             QMessageBox.warning(self, "No Files", "Please select files to convert.")
             return
 
-        self.config["output_dir"] = self.output_dir_edit.text()
-        self.config["bitrate"] = self.bitrate_combo.currentText()
-        self.config["channels"] = int(self.channels_combo.currentText())
-        self.config["samplerate"] = int(self.samplerate_combo.currentText())
-        self.config["video_codec"] = self.video_codec_combo.currentText()
-        self.config["subtitle_codec"] = self.subtitle_codec_combo.currentText()
-        self.config["metadata_title"] = "AAC Stereo"
-        self.config["force_8bit"] = self.force8_checkbox.isChecked()
-        self.config["x264_crf"] = int(self.crf_combo.currentText())
-        self.config["x264_preset"] = self.preset_combo.currentText()
-
-        os.makedirs(self.config["output_dir"], exist_ok=True)
-
         self.convert_btn.setEnabled(False)
         self.select_file_btn.setEnabled(False)
         self.select_dir_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
 
-        self.log_text.clear()
+        self.clear_log()
         self.log_updated("Starting conversion...")
 
+        # snapshot: widgets keep editing self.config while the worker runs
+        config = dict(self.config)
         self.converter_thread = AudioConverterThread(
             self.selected_files,
-            self.config["output_dir"],
-            self.config
+            config["output_dir"],
+            config
         )
         self.converter_thread.overall_progress_updated.connect(self.update_overall_progress)
         self.converter_thread.file_progress_updated.connect(self.update_file_progress)
@@ -734,44 +1503,85 @@ class AudioNormalizationApp(QMainWindow):
         self.converter_thread.start()
 
     def cancel_conversion(self):
-        if self.converter_thread and self.converter_thread.isRunning():
-            self.converter_thread.stop()
+        thread = self.converter_thread
+        if thread and thread.isRunning():
+            thread.stop()
+            # Keep the GUI responsive while workers shut down instead of
+            # blocking in QThread.wait().
+            loop = QEventLoop()
+            thread.finished.connect(loop.quit)
+            QTimer.singleShot(5000, loop.quit)
+            if thread.isRunning():
+                loop.exec_()
             self.log_updated("Conversion cancelled by user.")
             self.reset_ui()
 
+    def _schedule_flush(self):
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _flush_pending(self):
+        if self._pending_overall is not None:
+            self.overall_progress_bar.setValue(self._pending_overall)
+            self._pending_overall = None
+        if self._pending_file is not None:
+            value = self._pending_file
+            self._pending_file = None
+            if value < 0:
+                self.file_progress_bar.setRange(0, 0)  # indeterminate
+            else:
+                if self.file_progress_bar.minimum() == 0 and self.file_progress_bar.maximum() == 0:
+                    self.file_progress_bar.setRange(0, 100)  # determinate
+                self.file_progress_bar.setValue(value)
+        if self._pending_eta is not None:
+            self.file_eta_label.setText(self._pending_eta)
+            self._pending_eta = None
+        if self._pending_log:
+            self.log_text.appendPlainText("\n".join(self._pending_log))
+            self._pending_log.clear()
+
     def update_overall_progress(self, value):
-        self.overall_progress_bar.setValue(value)
-        QApplication.processEvents()
+        self._pending_overall = value
+        self._schedule_flush()
 
     def update_file_progress(self, value):
-        if value < 0:
-            self.file_progress_bar.setRange(0, 0)  # indeterminate
-        else:
-            if self.file_progress_bar.minimum() == 0 and self.file_progress_bar.maximum() == 0:
-                self.file_progress_bar.setRange(0, 100)  # determinate
-            self.file_progress_bar.setValue(value)
-        QApplication.processEvents()
+        self._pending_file = value
+        self._schedule_flush()
 
     def update_eta(self, text):
-        self.file_eta_label.setText(text)
-        QApplication.processEvents()
+        self._pending_eta = text
+        self._schedule_flush()
 
     def on_current_file_changed(self, name, idx, total):
-        self.current_file_label.setText(f"{idx}/{total} — {name}")
+        # Values still pending belong to the previous file.
+        self._pending_file = None
+        self._pending_eta = None
+        self._set_current_file_text(f"{idx}/{total} — {name}")
         self.file_progress_bar.setRange(0, 100)
         self.file_progress_bar.setValue(0)
         self.file_eta_label.setText("calculating…")
 
+    def _set_current_file_text(self, text):
+        self._current_file_text = text
+        self.current_file_label.setToolTip(text)
+        self._elide_current_file()
+
+    def _elide_current_file(self):
+        label = self.current_file_label
+        label.setText(label.fontMetrics().elidedText(self._current_file_text, Qt.ElideMiddle, label.width()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._elide_current_file()
+
     def log_updated(self, message):
-        self.log_text.append(message)
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-        QApplication.processEvents()
+        self._pending_log.append(message)
+        self._schedule_flush()
 
     def conversion_complete(self):
         self.log_updated("Conversion complete!")
         QMessageBox.information(self, "Complete",
-                                f"Processing complete. Converted files are in the '{self.config['output_dir']}' directory.")
+                                f"Processing complete. Converted files are in the '{self.converter_thread.output_dir}' directory.")
         self.reset_ui()
 
     def show_error(self, error_message):
@@ -779,6 +1589,8 @@ class AudioNormalizationApp(QMainWindow):
         self.reset_ui()
 
     def reset_ui(self):
+        self._refresh_timer.stop()
+        self._flush_pending()
         self.convert_btn.setEnabled(True)
         self.select_file_btn.setEnabled(True)
         self.select_dir_btn.setEnabled(True)
@@ -787,9 +1599,10 @@ class AudioNormalizationApp(QMainWindow):
         self.file_progress_bar.setRange(0, 100)
         self.file_progress_bar.setValue(0)
         self.file_eta_label.setText("--:-- remaining")
-        self.current_file_label.setText("--")
+        self._set_current_file_text("--")
 
     def clear_log(self):
+        self._pending_log.clear()
         self.log_text.clear()
 
 